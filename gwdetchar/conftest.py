@@ -25,6 +25,13 @@ from unittest import mock
 import pytest
 
 
+def pytest_configure(config):
+    """Select the non-interactive Agg backend before any tests are collected
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+
+
 def fake_package_list():
     """Fake return for `gwdetchar.io.html.package_list`
 
@@ -26,10 +26,18 @@ from gwpy.segments import Segment
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
-IFO = os.getenv('IFO', None)
-ifo = os.getenv('ifo', IFO.lower() if IFO else None)
-SITE = os.getenv('SITE', None)
-site = os.getenv('site', SITE.lower() if SITE else None)
+
+def _refresh_ifo():
+    """(Re-)read the interferometer and site prefixes from the environment
+    """
+    global IFO, ifo, SITE, site
+    IFO = os.getenv('IFO', None)
+    ifo = os.getenv('ifo', IFO.lower() if IFO else None)
+    SITE = os.getenv('SITE', None)
+    site = os.getenv('site', SITE.lower() if SITE else None)
+
+
+_refresh_ifo()
 
 DEFAULT_SEGMENT_SERVER = os.getenv('DEFAULT_SEGMENT_SERVER',
                                    'https://segments.ligo.org')
@@ -37,9 +37,6 @@ from .. import html
 from ..._version import __version__ as gwdetchar_version
 from ...utils import parse_html
 
-from matplotlib import use
-use('Agg')
-
 __author__ = 'Alex Urban <alexander.urban@ligo.org>'
 
 
@@ -283,6 +283,25 @@ def _process_channel(input_):
     return (chan, lassocoef, plot4, plot5, plot6, ts)
 
 
+def find_data_segments(ifo, frametype, segments):
+    """Find the segments covered by frame files of a given type
+
+    The frame file URLs for all segments are collected first, then parsed
+    in a single pass and the resulting file spans are coalesced
+    """
+    # query serially, `gwpy.io.datafind.find_urls` is not thread-safe
+    urls = [url for seg in segments for url in
+            find_urls(ifo, frametype, seg[0], seg[1])]
+
+    data_segs = SegmentList([])
+    for url in urls:
+        filedata = os.path.splitext(os.path.basename(url))[0].split('-')
+        filestart = int(filedata[-2])
+        fileend = filestart + int(filedata[-1])
+        data_segs.append(Segment(filestart, fileend))
+    return data_segs.coalesce()
+
+
 def get_primary_ts(channel, start, end, filepath=None,
                    frametype=None, cache=None, nproc=1):
     """Retrieve primary channel timeseries
@@ -590,32 +609,12 @@ def main(args=None):
         # First the primary channel frametype: make a list of segments
         # that the data URLs cover. Join segments that are contiguous.
         # Finally, take the intersection of the segments
-        data_segs = SegmentList([])
-        for i, seg in enumerate(lasso_segs):
-            cache = find_urls(args.ifo[0], args.primary_frametype,
-                              seg[0], seg[1])
-            for url in cache:
-                filedata = os.path.splitext(
-                    os.path.basename(url))[0].split('-')
-                filestart = int(filedata[-2])
-                fileend = filestart + int(filedata[-1])
-                data_segs.append(Segment(filestart, fileend))
-        data_segs.coalesce()
-        lasso_segs &= data_segs
+        lasso_segs &= find_data_segments(
+            args.ifo[0], args.primary_frametype, lasso_segs)
 
         # Same as above, but this time for the auxiliary frametype
-        data_segs = SegmentList([])
-        for i, seg in enumerate(lasso_segs):
-            cache = find_urls(args.ifo[0], aux_frametype,
-                              seg[0], seg[1])
-            for url in cache:
-                filedata = os.path.splitext(
-                    os.path.basename(url))[0].split('-')
-                filestart = int(filedata[-2])
-                fileend = filestart + int(filedata[-1])
-                data_segs.append(Segment(filestart, fileend))
-        data_segs.coalesce()
-        lasso_segs &= data_segs
+        lasso_segs &= find_data_segments(
+            args.ifo[0], aux_frametype, lasso_segs)
 
     # Loop over lasso segments
     files = []
@@ -1,9 +1,16 @@
 """Tests for gwdetchar.lasso.__main__
 """
+import threading
+
 import pytest
 
 import numpy as np
 
+from unittest import mock
+
+import gwdatafind
+
+from gwpy.segments import (Segment, SegmentList)
 from gwpy.timeseries import TimeSeries
 
 from .. import __main__ as lasso
@@ -54,3 +61,43 @@ def test_read(expected_ts, expected_ts_file):
         actual_ts.value,
         expected_ts.value,
         err_msg='read in data array does not match')
+
+
+@mock.patch('gwdetchar.lasso.__main__.find_urls')
+def test_find_data_segments(find_urls):
+    urls = {
+        0: ['file:///X-X1_TEST-0-4.gwf', 'file:///X-X1_TEST-4-4.gwf'],
+        10: ['file:///X-X1_TEST-10-4.gwf'],
+    }
+    find_urls.side_effect = lambda ifo, frametype, start, end: urls[start]
+    segs = lasso.find_data_segments(
+        'X', 'X1_TEST', SegmentList([Segment(0, 8), Segment(10, 14)]))
+    assert segs == SegmentList([Segment(0, 8), Segment(10, 14)])
+    assert {call.args for call in find_urls.call_args_list} == {
+        ('X', 'X1_TEST', 0, 8),
+        ('X', 'X1_TEST', 10, 14),
+    }
+
+
+def test_find_data_segments_datafind(monkeypatch):
+    # run through the real `gwpy.io.datafind.find_urls` wrapper, which is
+    # not thread-safe, and check every query is made from the caller
+    urls = {
+        0: ['file:///X-X1_TEST-0-4.gwf', 'file:///X-X1_TEST-4-4.gwf'],
+        10: ['file:///X-X1_TEST-10-4.gwf'],
+        20: ['file:///X-X1_TEST-20-4.gwf'],
+    }
+    threads = set()
+
+    def _find_urls(site, frametype, start, end, **kwargs):
+        threads.add(threading.get_ident())
+        return urls[start]
+
+    monkeypatch.setenv('GWDATAFIND_SERVER', 'datafind.example.com')
+    monkeypatch.setattr(gwdatafind, 'find_urls', _find_urls)
+    segs = lasso.find_data_segments(
+        'X', 'X1_TEST',
+        SegmentList([Segment(0, 8), Segment(10, 14), Segment(20, 24)]))
+    assert segs == SegmentList(
+        [Segment(0, 8), Segment(10, 14), Segment(20, 24)])
+    assert threads == {threading.get_ident()}
@@ -27,14 +27,11 @@ import shutil
 from gwpy.timeseries import TimeSeries
 
 from matplotlib import (
-    use,
     rcParams,
     rcParamsDefault,
 )
-use('Agg')
 
-# backend-dependent import
-from .. import plot  # noqa: E402
+from .. import plot
 
 __author__ = 'Alex Urban <alexander.urban@ligo.org>'
 
@@ -20,8 +20,6 @@
 """
 
 import json
-import os
-import shutil
 
 from random import randrange
 from numpy.testing import assert_equal
@@ -39,20 +37,19 @@ TIMEOUT = 3600
 
 # -- cli tests ----------------------------------------------------------------
 
-def test_main(tmpdir, caplog):
-    outdir = str(tmpdir)
-    outfile = os.path.join(outdir, "test.json")
+def test_main(tmp_path, caplog):
+    outfile = tmp_path / "test.json"
     # test the status generator
     nagios_cli.main([
         str(STATUS),
         MESSAGE,
         '--timeout', str(TIMEOUT),
-        '--output-file', outfile,
+        '--output-file', str(outfile),
     ])
     assert 'Status written to {}'.format(outfile) in caplog.text
-    assert os.path.isfile(outfile)
+    assert outfile.is_file()
     # test output
-    with open(outfile, 'r') as fobj:
+    with outfile.open('r') as fobj:
         status = json.load(fobj)
     assert isinstance(status['created_gps'], int)
     assert isinstance(status['status_intervals'], list)
@@ -68,5 +65,3 @@ def test_main(tmpdir, caplog):
          'txt_status': 'Process timed out',
          'num_status': 3},
     )
-    # clean up
-    shutil.rmtree(outdir, ignore_errors=True)
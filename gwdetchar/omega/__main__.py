@@ -69,10 +69,7 @@ def _finalize_html(analyzed, ifo, gps, htmlv):
 def _init_analyzed_channels():
     """Initialize a running, ordered record of analyzed channels
     """
-    if sys.version_info >= (3, 7):  # python 3.7+
-        return {}
-    from collections import OrderedDict
-    return OrderedDict()
+    return {}
 
 
 def _load_channel_record(summary, use_checkpoint=True, correlate=True):
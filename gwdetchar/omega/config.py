@@ -134,7 +134,6 @@ An example using many of the above options would look something like this:
    account houses default configurations organized by subsystem.
 """
 
-import sys
 import ast
 import os.path
 import configparser
@@ -145,9 +144,6 @@ from gwpy.detector import Channel
 from .. import const
 from ..io.html import FancyPlot
 
-if sys.version_info < (3, 7):
-    from collections import OrderedDict
-
 __author__ = 'Alex Urban <alexander.urban@ligo.org>'
 __credits__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
@@ -196,11 +192,7 @@ class OmegaConfigParser(configparser.ConfigParser):
         read in and preserved from the source configuration.
         """
         # retrieve an ordered dictionary of channel blocks
-        if sys.version_info >= (3, 7):  # python 3.7+
-            return {s: OmegaChannelList(s, **self[s]) for s in self.sections()}
-        else:
-            return OrderedDict([(s, OmegaChannelList(s, **dict(self.items(s))))
-                                for s in self.sections()])
+        return {s: OmegaChannelList(s, **self[s]) for s in self.sections()}
 
 
 # -- utilities ----------------------------------------------------------------
@@ -28,13 +28,7 @@ from scipy import signal
 
 from gwpy.timeseries import TimeSeries
 
-from .. import (config, core)
-
-from matplotlib import use
-use('agg')  # noqa
-
-# backend-dependent import
-from .. import plot  # noqa: E402
+from .. import (config, core, plot)
 
 __author__ = 'Alex Urban <alexander.urban@ligo.org>'
 
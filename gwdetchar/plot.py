@@ -19,6 +19,8 @@
 """Plotting utilities
 """
 
+from functools import lru_cache
+
 from matplotlib import rcParams
 
 from gwpy.plot.tex import label_to_latex
@@ -30,6 +32,13 @@ __credits__ = 'Dan Hoak <daniel.hoak@ligo.org>, ' \
 
 # -- plotting utilities -------------------------------------------------------
 
+@lru_cache(maxsize=1024)
+def _label_to_latex(text):
+    """Cached version of `gwpy.plot.tex.label_to_latex`
+    """
+    return label_to_latex(text)
+
+
 def texify(text):
     """Helper utility to detect when LaTeX rendering is used, and convert
     text to a LaTeX-passable representation if necessary
@@ -50,7 +59,7 @@ def texify(text):
         the underlying method to convert to a LaTeX representation
     """
     if rcParams['text.usetex']:
-        return label_to_latex(text)
+        return _label_to_latex(text)
     return text or ''
 
 
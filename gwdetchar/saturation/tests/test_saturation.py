@@ -22,19 +22,22 @@
 import pytest
 
 import numpy
-from numpy.testing import assert_array_equal
 
+from types import SimpleNamespace
 from unittest import mock
 
+from astropy.units import Quantity
+
 from gwpy.segments import (Segment, SegmentList, DataQualityFlag)
 from gwpy.timeseries import (TimeSeries, TimeSeriesDict)
 from gwpy.testing.utils import assert_segmentlist_equal
 
+from ...io import datafind
 from .. import core
 
 # global test objects
 
-DATA = TimeSeries([1, 2, 3, 4, 5, 5, 5, 4, 5, 4], dx=.5, name='X1:TEST_OUTPUT')
+LIMIT = Quantity(5.)
 SATURATIONS = numpy.array([2., 4.])
 SEGMENTS = SegmentList([
     Segment(2., 3.5),
@@ -46,59 +49,90 @@ CHANNELS = [
     'X1:TEST_LIMEN',
     'X1:TEST_SWSTAT',
 ]
-TSDICT = TimeSeriesDict({
-    'X1:TEST_LIMEN': TimeSeries(numpy.ones(10), dx=.5, name='X1:TEST_LIMEN'),
-    'X1:TEST_OUTPUT': DATA,
-    'X1:TEST_LIMIT': TimeSeries(5*numpy.ones(10), dx=.5, name='X1:TEST_LIMIT'),
-})
+
+GROUPER_INPUT = range(100)
+GROUPER_EXPECTED = tuple(map(tuple, numpy.arange(100).reshape(20, 5).tolist()))
+
+
+@pytest.fixture(scope='module')
+def data():
+    return TimeSeries(
+        [1, 2, 3, 4, 5, 5, 5, 4, 5, 4],
+        dx=.5,
+        name='X1:TEST_OUTPUT',
+    )
+
+
+@pytest.fixture(scope='module')
+def tsdict(data):
+    return TimeSeriesDict({
+        'X1:TEST_LIMEN': TimeSeries(
+            numpy.ones(10), dx=.5, name='X1:TEST_LIMEN'),
+        'X1:TEST_OUTPUT': data,
+        'X1:TEST_LIMIT': TimeSeries(
+            5*numpy.ones(10), dx=.5, name='X1:TEST_LIMIT'),
+    })
 
 
 # -- unit tests ---------------------------------------------------------------
 
-def test_find_saturations():
-    sats = core.find_saturations(DATA, limit=5., segments=False)
-    assert_array_equal(sats, SATURATIONS)
-    segs = core.find_saturations(DATA, limit=5.*DATA.unit, segments=True)
-    assert_segmentlist_equal(segs.active, SEGMENTS)
+@pytest.mark.parametrize('limit, segments, expected', [
+    (5., False, SATURATIONS),
+    (LIMIT, True, SEGMENTS),
+])
+def test_find_saturations(data, limit, segments, expected):
+    out = core.find_saturations(data, limit=limit, segments=segments)
+    if segments:
+        assert_segmentlist_equal(out.active, expected)
+    else:
+        assert numpy.array_equal(out, expected)
 
 
-def test_find_saturations_wrapper():
-    segs = core._find_saturations((DATA, 5.))
+def test_find_saturations_wrapper(data):
+    segs = core._find_saturations((data, 5.))
     assert_segmentlist_equal(segs.active, SEGMENTS)
-    assert segs.name == DATA.name[:-7]
+    assert segs.name == data.name[:-7]
 
 
 def test_grouper():
-    in_ = range(100)
-    grouped = list(core.grouper(in_, 5))
-    expected = [tuple(range(i, i+5)) for i in range(0, 100, 5)]
-    assert_array_equal(grouped, expected)
+    assert tuple(core.grouper(GROUPER_INPUT, 5)) == GROUPER_EXPECTED
 
 
 def test_find_limit_channels():
     limens, swstats = core.find_limit_channels(CHANNELS)
     assert len(limens) == len(swstats)
-    assert_array_equal(limens, ['X1:TEST'])
-    assert_array_equal(swstats, ['X1:TEST'])
+    assert list(limens) == ['X1:TEST']
+    assert list(swstats) == ['X1:TEST']
 
     limens2, swstats2 = core.find_limit_channels(CHANNELS, skip='TEST')
     assert not limens2
     assert not swstats2
 
 
-@mock.patch('gwdetchar.io.datafind.remove_missing_channels')
-@mock.patch('gwpy.timeseries.TimeSeriesDict.read')
-def test_is_saturated(tsdfetch, remove):
+@pytest.fixture
+def patched_io(monkeypatch, tsdict):
+    """Mock out data discovery and reading for `core.is_saturated`
+    """
+    read = mock.MagicMock(return_value=tsdict)
+    remove = mock.MagicMock(return_value=['X1:TEST_LIMIT'])
+    monkeypatch.setattr(TimeSeriesDict, 'read', read)
+    monkeypatch.setattr(datafind, 'remove_missing_channels', remove)
+    return SimpleNamespace(read=read, remove=remove)
+
+
+def test_is_saturated(patched_io):
     cache = [
         "X-TEST-0-1.gwf",
     ]
 
-    tsdfetch.return_value = TSDICT
-    remove.return_value = ['X1:TEST_LIMIT']
-
     saturated = core.is_saturated('X1:TEST', cache, start=0, end=8)
     assert isinstance(saturated, DataQualityFlag)
     assert_segmentlist_equal(saturated.active, SEGMENTS)
+    assert patched_io.remove.call_args_list == [
+        mock.call(['X1:TEST_LIMEN'], cache),
+        mock.call(['X1:TEST_LIMIT', 'X1:TEST_OUTPUT'], cache),
+    ]
+    assert patched_io.read.call_count == 2
 
     saturated2 = core.is_saturated(
         ['X1:TEST_LIMIT'], cache, start=0, end=8)
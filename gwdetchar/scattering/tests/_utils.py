@@ -0,0 +1,38 @@
+# coding=utf-8
+# Copyright (C) LIGO Scientific Collaboration (2026)
+#
+# This file is part of the GW DetChar python package.
+#
+# GW DetChar is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GW DetChar is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GW DetChar.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Utilities for the :mod:`gwdetchar.scattering` tests
+"""
+
+import numpy
+
+
+def _fast_inject(dst, src):
+    """Add ``src`` into ``dst`` in-place, bypassing `TimeSeries.inject`
+
+    The test fixtures in this package are always built with matching
+    sample rates, epochs, and units, so injection reduces to a simple
+    array addition. Note that ``dst`` is modified and returned, so pass
+    a copy if the original data must be preserved.
+    """
+    assert dst.sample_rate == src.sample_rate
+    assert dst.t0 == src.t0
+    assert dst.unit == src.unit
+    assert dst.size == src.size
+    numpy.add(dst.value, src.value, out=dst.value)
+    return dst
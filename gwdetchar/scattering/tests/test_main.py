@@ -36,6 +36,7 @@ from gwpy.timeseries import (
     TimeSeriesDict,
 )
 
+from ._utils import _fast_inject
 from .. import __main__ as scattering_cli
 
 __author__ = 'Alex Urban <alexander.urban@ligo.org>'
@@ -81,11 +82,11 @@ AUX = TimeSeriesDict({
         ).crop(4, DURATION - 4) for chan in OSEMS[1::]
     },
     **{
-        ':'.join([IFO, chan]): TimeSeries(
+        ':'.join([IFO, chan]): _fast_inject(TimeSeries(
             numpy.random.normal(loc=1, scale=1.5, size=SCATTER.size),
             sample_rate=SAMPLE,
             name=':'.join([IFO, chan]),
-        ).inject(SCATTER).crop(
+        ), SCATTER).crop(
             4, DURATION - 4) for chan in scattering_cli.TRANSMON_CHANNELS},
 })
 
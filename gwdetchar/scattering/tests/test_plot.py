@@ -25,11 +25,8 @@ import shutil
 
 from gwpy.timeseries import TimeSeries
 
-from matplotlib import use
-use('Agg')
-
-# backend-dependent import
-from .. import plot  # noqa: E402
+from ._utils import _fast_inject
+from .. import plot
 
 __author__ = 'Alex Urban <alexander.urban@ligo.org>'
 
@@ -43,7 +40,7 @@ NOISE = TimeSeries(
     sample_rate=16384, epoch=-32).zpk([], [0], 1)
 FRINGE = TimeSeries(
     numpy.cos(TWOPI * TIMES), sample_rate=16384, epoch=-32)
-DATA = NOISE.inject(FRINGE)
+DATA = _fast_inject(NOISE.copy(), FRINGE)
 QSPECGRAM = DATA.q_transform(logf=True, method="median")
 
 
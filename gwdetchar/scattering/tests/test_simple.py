@@ -31,6 +31,7 @@ from gwpy.timeseries import (
     TimeSeriesDict,
 )
 
+from ._utils import _fast_inject
 from .. import simple
 
 __author__ = 'Alex Urban <alexander.urban@ligo.org>'
@@ -55,10 +56,10 @@ SCATTER = TimeSeries(
     sample_rate=SAMPLE,
 )
 
-HOFT = TimeSeries(
+HOFT = _fast_inject(TimeSeries(
     numpy.random.normal(loc=1, scale=1.5, size=SCATTER.size),
     sample_rate=SAMPLE,
-).inject(SCATTER.highpass(10))
+), SCATTER.highpass(10))
 
 AUX = TimeSeriesDict({
     ':'.join([IFO, chan]): TimeSeries(
@@ -21,10 +21,7 @@
 
 import logging
 import argparse
-try:
-    from importlib import reload
-except ImportError:  # python < 3
-    reload = reload
+from importlib import reload
 
 import pytest
 
@@ -19,34 +19,31 @@
 """Test suite for `gwdetchar.const`
 """
 
-import os
-
-try:
-    from importlib import reload
-except ImportError:  # python < 3
-    reload = reload
-
 import pytest
 
 from .. import const as _const
 
-_DEFAULT_ENV = os.environ.copy()
+_ENV_KEYS = ('IFO', 'ifo', 'SITE', 'site')
 
 
 @pytest.fixture
-def const():
-    yield _const
-    reload(_const)
-    os.environ.update(_DEFAULT_ENV)
+def const(monkeypatch):
+    # clear the environment, and make sure the module-level
+    # prefixes are restored when the test finishes
+    for key in _ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+        monkeypatch.setattr(_const, key, getattr(_const, key))
+    return _const
 
 
 @pytest.mark.parametrize('env', [
     {},
     {'IFO': 'X1'},
 ])
-def test_const(const, env):
-    os.environ.update(env)
-    reload(const)
+def test_const(const, monkeypatch, env):
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    const._refresh_ifo()
     if env:
         assert const.IFO == env['IFO']
         assert const.ifo == const.IFO.lower()
@@ -70,9 +67,9 @@ def test_gps_epoch_valueerror():
         _const.gps_epoch(-1, default=None)
 
 
-def test_latest_epoch(const):
-    const.EPOCH = {
+def test_latest_epoch(const, monkeypatch):
+    monkeypatch.setattr(const, 'EPOCH', {
         'test1': (0, 10),
         'test2': (10, 20),
-    }
+    })
     assert const.latest_epoch() == 'test2'
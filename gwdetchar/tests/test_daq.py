@@ -22,7 +22,7 @@
 import numpy
 import pytest
 
-from numpy.testing import assert_array_equal
+from types import SimpleNamespace
 from unittest import mock
 
 from gwpy.timeseries import TimeSeries
@@ -31,8 +31,6 @@ from gwpy.testing.utils import assert_segmentlist_equal
 
 from .. import daq
 
-OVERFLOW_SERIES = TimeSeries([0, 0, 0, 1, 1, 0, 0, 1, 0, 1], dx=.5)
-CUMULATIVE_SERIES = TimeSeries([0, 0, 0, 1, 2, 2, 2, 3, 3, 4], dx=.5)
 OVERFLOW_TIMES = numpy.array([1.5, 3.5, 4.5])
 OVERFLOW_SEGMENTS = SegmentList([
     Segment(1.5, 2.5),
@@ -54,14 +52,25 @@ CHANNELS = [
 ]
 
 
+@pytest.fixture(scope='module')
+def overflow_series():
+    return TimeSeries([0, 0, 0, 1, 1, 0, 0, 1, 0, 1], dx=.5)
+
+
+@pytest.fixture(scope='module')
+def cumulative_series():
+    return TimeSeries([0, 0, 0, 1, 2, 2, 2, 3, 3, 4], dx=.5)
+
+
 @pytest.mark.parametrize('cmltv, series', [
-    (False, OVERFLOW_SERIES),
-    (True, CUMULATIVE_SERIES),
+    (False, 'overflow_series'),
+    (True, 'cumulative_series'),
 ])
-def test_find_overflows_and_segments(cmltv, series):
+def test_find_overflows_and_segments(request, cmltv, series):
+    series = request.getfixturevalue(series)
     # find overflows
     times = daq.find_overflows(series, cumulative=cmltv)
-    assert_array_equal(times, OVERFLOW_TIMES)
+    assert numpy.array_equal(times, OVERFLOW_TIMES)
 
     # find segments
     segments = daq.find_overflow_segments(series, cumulative=cmltv)
@@ -73,31 +82,39 @@ def test_ligo_accum_overflow_channel():
         'X1:FEC-4_ACCUM_OVERFLOW')
 
 
-@mock.patch('gwdetchar.daq.find_urls')
-@mock.patch('gwdetchar.daq.get_channel_names')
-@mock.patch('gwdetchar.daq._ligo_model_overflow_channels_nds')
-def test_ligo_model_overflow_channels(nds, get_names, find_frames):
-    get_names.return_value = CHANNELS
+@pytest.fixture
+def patched_daq(monkeypatch):
+    """Mock out frame and NDS channel discovery in `gwdetchar.daq`
+    """
+    find = mock.MagicMock()
+    names = mock.MagicMock(return_value=CHANNELS)
+    nds = mock.MagicMock()
+    monkeypatch.setattr(daq, 'find_urls', find)
+    monkeypatch.setattr(daq, 'get_channel_names', names)
+    monkeypatch.setattr(daq, '_ligo_model_overflow_channels_nds', nds)
+    return SimpleNamespace(find=find, names=names, nds=nds)
+
 
+def test_ligo_model_overflow_channels(patched_daq):
     names = daq.ligo_model_overflow_channels(1, ifo='X1', accum=True)
     assert names == CHANNELS[1:5]
 
     names = daq.ligo_model_overflow_channels(1, ifo='X1', accum=False)
     assert names == CHANNELS[5:7]
 
-    nds.return_value = CHANNELS
+    patched_daq.nds.return_value = CHANNELS
     names = daq.ligo_model_overflow_channels(1, ifo='X1', accum=False)
     assert names == CHANNELS[5:7]
 
-    find_frames.return_value = []
+    patched_daq.find.return_value = []
     with pytest.raises(IndexError) as exc:
         daq.ligo_model_overflow_channels(1, ifo='X1')
     assert str(exc.value).startswith('No X-X1_R frames found')
 
 
-def test_find_crossings():
-    times = daq.find_crossings(OVERFLOW_SERIES, 0.1)
-    assert_array_equal(times, CROSSING_TIMES)
+def test_find_crossings(overflow_series):
+    times = daq.find_crossings(overflow_series, 0.1)
+    assert numpy.array_equal(times, CROSSING_TIMES)
 
-    times0 = daq.find_crossings(OVERFLOW_SERIES, 0)
-    assert_array_equal(times0, [])
+    times0 = daq.find_crossings(overflow_series, 0)
+    assert len(times0) == 0
@@ -38,6 +38,9 @@ from .. import utils
     ([1, 10, 2, 3], [1, 2, 3, 10]),
     (['1', '10', '2', '3'], ['1', '2', '3', '10']),
     (['a', 'b', 'd', 'c'], ['a', 'b', 'c', 'd']),
+    (['X1:A-10', 'X1:A-2', 'X1:A-2', 'X1:B-1'],
+     ['X1:A-2', 'X1:A-2', 'X1:A-10', 'X1:B-1']),
+    (['b', '10a', 'a2', 'a10'], ['10a', 'a2', 'a10', 'b']),
 ])
 def test_natural_sort(in_, out):
     assert utils.natural_sort(in_) == out
@@ -97,3 +100,17 @@ def test_table_from_times():
         EventTable([times, [100.] * 10, [10.] * 10],
                    names=("time", "frequency", "snr")),
     )
+
+
+@pytest.mark.parametrize('times', [
+    [0., 1., 2.],
+    [],
+])
+def test_table_from_times_list(times):
+    assert_table_equal(
+        utils.table_from_times(times),
+        EventTable([numpy.asarray(times),
+                    [100.] * len(times),
+                    [10.] * len(times)],
+                   names=("time", "frequency", "snr")),
+    )
@@ -20,41 +20,42 @@
 """
 
 import re
-import sys
-from io import StringIO
-from functools import partial
+from operator import itemgetter
 from html.parser import HTMLParser
 
 import numpy
 
-from gwpy.table import EventTable
-
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 __credits__ = 'Alex Urban <alexander.urban@ligo.org>'
 
+re_digits = re.compile('([0-9]+)')
+
 
 # -- class for HTML parsing ---------------------------------------------------
 
 class GWHTMLParser(HTMLParser):
     """See https://docs.python.org/3/library/html.parser.html.
+
+    Parsed events are recorded, one per line, in the ``buf`` list
     """
+    def __init__(self, buf=None, **kwargs):
+        super().__init__(**kwargs)
+        self.buf = [] if buf is None else buf
+
     def handle_starttag(self, tag, attrs):
-        print("Start tag:", tag)
+        self.buf.append("Start tag: {}".format(tag))
         attrs.sort()
         for attr in attrs:
-            print("attr:", attr)
+            self.buf.append("attr: {}".format(attr))
 
     def handle_endtag(self, tag):
-        print("End tag:", tag)
+        self.buf.append("End tag: {}".format(tag))
 
     def handle_data(self, data):
-        print("Data:", data)
+        self.buf.append("Data: {}".format(data))
 
     def handle_decl(self, data):
-        print("Decl:", data)
-
-
-parser = GWHTMLParser()
+        self.buf.append("Decl: {}".format(data))
 
 
 # -- utilities ----------------------------------------------------------------
@@ -62,15 +63,9 @@ parser = GWHTMLParser()
 def parse_html(html):
     """Parse a string containing raw HTML code
     """
-    stdout = sys.stdout
-    sys.stdout = StringIO()
-    if sys.version_info.major < 3:
-        parser.feed(html.decode('utf-8', 'ignore'))
-    else:
-        parser.feed(html)
-    output = sys.stdout.getvalue()
-    sys.stdout = stdout
-    return output
+    parser = GWHTMLParser()
+    parser.feed(html)
+    return ''.join(line + '\n' for line in parser.buf)
 
 
 def natural_sort(ls, key=str):
@@ -95,37 +90,55 @@ def natural_sort(ls, key=str):
     ls = list(ls)
     k = list(map(key, ls)) if key else ls
 
-    def convert(text):
-        return int(text) if text.isdigit() else text
+    def alphanum_key(text):
+        # splitting on a capturing group always alternates
+        # non-digit, digit, non-digit, ..., so the digit runs
+        # are exactly the odd-indexed tokens
+        tokens = re_digits.split(text)
+        tokens[1::2] = map(int, tokens[1::2])
+        return tokens
 
-    def alphanum_key(key):
-        return [convert(c) for c in
-                re.split('([0-9]+)', k[ls.index(key)])]
-
-    return sorted(ls, key=alphanum_key)
+    # decorate each element with its key once, then sort on the keys;
+    # if no key contains any digits, plain string ordering is identical
+    if any(map(re_digits.search, k)):
+        k = list(map(alphanum_key, k))
+    return [x for _, x in sorted(zip(k, ls), key=itemgetter(0))]
 
 
 def table_from_segments(flagdict, sngl_burst=False, snr=10., frequency=100.):
     """Build an `EventTable` from a `DataQualityDict`
     """
-    rows = []
+    from gwpy.table import EventTable
+
     if sngl_burst:
         names = ("peak", "peak_frequency", "snr", "channel")
-
-        def row(seg, channel):
-            a, b = map(float, seg)
-            return a, frequency, snr, channel
     else:
         names = ("time", "frequency", "start_time", "end_time",
                  "snr", "channel")
 
-        def row(seg, channel):
-            a, b = map(float, seg)
-            return a, frequency, a, b, snr, channel
-
+    # stack the (start, end) pairs and channel names for all flags
+    segments = []
+    channels = []
     for name, flag in flagdict.items():
-        rows.extend(map(partial(row, channel=name), flag.active))
-    table = EventTable(rows=rows or None, names=names)
+        if not flag.active:
+            continue
+        segs = numpy.asarray(flag.active, dtype=float).reshape(-1, 2)
+        segments.append(segs)
+        channels.append(numpy.full(len(segs), name))
+
+    if segments:
+        nrows = sum(map(len, segments))
+        start, end = numpy.concatenate(segments).T
+        channel = numpy.concatenate(channels)
+        farr = numpy.full(nrows, frequency)
+        sarr = numpy.full(nrows, snr)
+        if sngl_burst:
+            columns = [start, farr, sarr, channel]
+        else:
+            columns = [start, farr, start, end, sarr, channel]
+        table = EventTable(columns, names=names)
+    else:
+        table = EventTable(names=names)
     if sngl_burst:  # add tablename for GWpy's ligolw writer
         table.meta["tablename"] = "sngl_burst"
     return table
@@ -157,6 +170,11 @@ def table_from_times(times, names=("time", "frequency", "snr"),
     table : `~gwpy.table.EventTable`
         a new table filled with events at the given times
     """
-    farr = numpy.ones_like(times) * frequency
-    sarr = numpy.ones_like(times) * snr
+    from gwpy.table import EventTable
+
+    times = numpy.asarray(times)
+    farr = numpy.full(times.shape, frequency,
+                      dtype=numpy.result_type(times.dtype, frequency))
+    sarr = numpy.full(times.shape, snr,
+                      dtype=numpy.result_type(times.dtype, snr))
     return EventTable([times, farr, sarr], names=names, **kwargs)